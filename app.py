@@ -3,12 +3,15 @@ NexGen Logistics - Cost Intelligence Platform
 A Streamlit-based dashboard for predictive cost analysis and optimization
 """
 
+import html
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from plotly.colors import qualitative
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -23,12 +26,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for professional styling
-st.markdown("""
+# Custom CSS for professional styling. Page colors come from the theme in
+# .streamlit/config.toml; only component styles remain here. The block must be
+# emitted on every rerun, since Streamlit drops elements a rerun does not redraw.
+CUSTOM_CSS = """
     <style>
     .main {
         padding: 0rem 1rem;
-        background-color: #1a1a1a;
     }
     .stMetric {
         background-color: #2d2d2d;
@@ -72,8 +76,126 @@ st.markdown("""
     .insight-box strong {
         color: #e0e0e0;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .metric-card {
+        flex: 1;
+        background-color: #2d2d2d;
+        padding: 15px;
+        border-radius: 10px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    .metric-label {
+        font-size: 0.9rem;
+        color: #d0d0d0;
+    }
+    .metric-value {
+        font-size: 2rem;
+        color: #e0e0e0;
+        line-height: 1.4;
+    }
+    .metric-delta {
+        font-size: 0.9rem;
+    }
+    .metric-stack {
+        flex-direction: column;
+    }
+    
+    /* Home page truck animation */
+    @keyframes truck-drive {
+        0% {
+            transform: translateX(-100px);
+            opacity: 0;
+        }
+        10% {
+            opacity: 1;
+        }
+        90% {
+            opacity: 1;
+        }
+        100% {
+            transform: translateX(calc(100vw - 100px));
+            opacity: 0;
+        }
+    }
+    
+    @keyframes road-scroll {
+        0% {
+            background-position: 0 0;
+        }
+        100% {
+            background-position: 100px 0;
+        }
+    }
+    
+    .truck-container {
+        position: relative;
+        width: 100%;
+        height: 150px;
+        overflow: hidden;
+        margin: 20px 0;
+        background: linear-gradient(to bottom, #1e3a5f 0%, #2c5282 70%, #4a5568 70%, #4a5568 75%, transparent 75%);
+        border-radius: 10px;
+    }
+    
+    .road {
+        position: absolute;
+        bottom: 35px;
+        width: 100%;
+        height: 5px;
+        background: repeating-linear-gradient(
+            to right,
+            #fbbf24 0px,
+            #fbbf24 20px,
+            transparent 20px,
+            transparent 40px
+        );
+        animation: road-scroll 1s linear infinite;
+    }
+    
+    .truck-animated {
+        position: absolute;
+        bottom: 20px;
+        width: 120px;
+        height: 120px;
+        animation: truck-drive 8s ease-in-out infinite;
+    }
+    
+    .clouds {
+        position: absolute;
+        top: 20px;
+        width: 100%;
+        height: 60px;
+        background-image: 
+            radial-gradient(ellipse at 20% 50%, rgba(255,255,255,0.3) 0%, transparent 50%),
+            radial-gradient(ellipse at 60% 30%, rgba(255,255,255,0.2) 0%, transparent 50%),
+            radial-gradient(ellipse at 85% 40%, rgba(255,255,255,0.25) 0%, transparent 50%);
+        animation: road-scroll 20s linear infinite;
+    }
     </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Upper bound on points sent to the browser for per-order scatters
+MAX_SCATTER_POINTS = 2000
+
+# Marker colors for delivery status traces
+STATUS_COLORS = {
+    'On-Time': '#2ecc71',
+    'Slightly-Delayed': '#f39c12',
+    'Severely-Delayed': '#e74c3c'
+}
+
+# Qualitative palette for the cost category pie
+CATEGORY_COLORS = qualitative.Set3
+
+# Plotly client configs: summary charts render as static images; hover-driven charts
+# keep their tooltips but drop the mode bar and wheel zoom
+STATIC_CHART_CONFIG = {'staticPlot': True, 'displayModeBar': False}
+HOVER_CHART_CONFIG = {'displayModeBar': False, 'scrollZoom': False}
 
 # Initialize session state
 if 'data_processor' not in st.session_state:
@@ -83,8 +205,26 @@ if 'data_processor' not in st.session_state:
     st.session_state.current_page = "🏠 Home"
     st.session_state.show_documentation = False
 
-@st.cache_data
-def load_data():
+# Workspace CSVs read by DataProcessor.load_all_data
+DATA_FILES = ('orders.csv', 'delivery_performance.csv', 'routes_distance.csv',
+              'vehicle_fleet.csv', 'cost_breakdown.csv')
+
+def data_file_signatures():
+    """(name, mtime, size) of each workspace CSV, used to invalidate load_data"""
+    signatures = []
+    for name in DATA_FILES:
+        try:
+            stat = os.stat(name)
+            signatures.append((name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signatures.append((name, None, None))
+    return tuple(signatures)
+
+# The processor is a read-only resource after process_data: share the live object
+# instead of pickling and copying it for every session. Keying on the file signatures
+# rebuilds it only when a CSV changes on disk.
+@st.cache_resource
+def load_data(file_signatures):
     """Load and process all data"""
     try:
         processor = DataProcessor()
@@ -99,6 +239,12 @@ def load_data():
         st.error(f"Error loading data: {str(e)}")
         return None
 
+# Keyed on the file bytes, so processing the same upload again skips parsing
+@st.cache_data(show_spinner=False, max_entries=20)
+def parse_uploaded_csv(data):
+    """Parse an uploaded CSV with the processor's pyarrow reader and dtype normalization"""
+    return DataProcessor()._read_csv(io.BytesIO(data))
+
 def load_uploaded_data(uploaded_files):
     """Load and process uploaded CSV files"""
     try:
@@ -113,12 +259,13 @@ def load_uploaded_data(uploaded_files):
             'cost_breakdown.csv': 'costs'
         }
         
-        # Load uploaded files
+        # Load uploaded files: parse them concurrently (the pyarrow reader releases the
+        # GIL), then attach the frames to the processor on this thread
         files_loaded = {}
-        for uploaded_file in uploaded_files:
-            if uploaded_file.name in file_mapping:
-                df = pd.read_csv(uploaded_file)
-                df = processor._standardize_cols(df)
+        known_files = [f for f in uploaded_files if f.name in file_mapping]
+        with ThreadPoolExecutor(max_workers=max(len(known_files), 1)) as executor:
+            frames = executor.map(parse_uploaded_csv, [f.getvalue() for f in known_files])
+            for uploaded_file, df in zip(known_files, frames):
                 setattr(processor, file_mapping[uploaded_file.name], df)
                 files_loaded[uploaded_file.name] = True
         
@@ -140,41 +287,228 @@ def load_uploaded_data(uploaded_files):
         st.error(f"Error loading uploaded data: {str(e)}")
         return None
 
-def render_kpi_ribbon(processor):
-    """Render the executive KPI ribbon at the top"""
-    metrics = processor.get_key_metrics()
+@st.cache_data(show_spinner=False, hash_funcs={DataProcessor: lambda p: p.data_version})
+def get_leakage_views(processor, regions, priorities, carriers):
+    """Filter once and compute all Cost Leakage aggregates for a filter selection"""
+    filtered_data = processor.filter_data(list(regions), list(priorities), list(carriers))
+    return {
+        'leakage_metrics': processor.calculate_cost_leakage(filtered_data),
+        'route_matrix': processor.get_route_cost_matrix(filtered_data),
+        'waterfall_data': processor.get_cost_waterfall(filtered_data),
+        'speed_cost': processor.get_cost_speed_analysis(filtered_data, max_points=MAX_SCATTER_POINTS)
+    }
+
+# Figures are shared across sessions as-is (no pickling), so they must never be mutated
+# after construction; st.plotly_chart only serializes them
+@st.cache_resource(show_spinner=False, hash_funcs={DataProcessor: lambda p: p.data_version})
+def build_overview_figures(processor):
+    """Build the Overview charts once per dataset"""
+    import plotly.express as px  # deferred: only chart pages pay for plotly.express
+    
+    cost_by_category = processor.get_cost_by_category()
+    pie_fig = px.pie(
+        cost_by_category,
+        values='cost_amount',
+        names='cost_category',
+        hole=0.4,
+        color_discrete_sequence=CATEGORY_COLORS
+    )
+    pie_fig.update_traces(textposition='inside', textinfo='percent+label')
+    pie_fig.update_layout(height=400)
+    
+    trend_data = processor.get_revenue_cost_trend()
+    trend_fig = go.Figure()
+    trend_fig.add_trace(go.Scatter(
+        x=trend_data['month'],
+        y=trend_data['revenue'],
+        name='Revenue',
+        line=dict(color='#2ecc71', width=3),
+        fill='tonexty'
+    ))
+    trend_fig.add_trace(go.Scatter(
+        x=trend_data['month'],
+        y=trend_data['cost'],
+        name='Cost',
+        line=dict(color='#e74c3c', width=3),
+        fill='tozeroy'
+    ))
+    trend_fig.update_layout(
+        height=400,
+        hovermode='x unified',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
     
-    col1, col2, col3, col4 = st.columns(4)
+    carrier_perf = processor.get_carrier_performance()
+    carrier_fig = go.Figure(go.Scattergl(
+        x=carrier_perf['avg_cost'],
+        y=carrier_perf['on_time_percentage'],
+        mode='markers',
+        text=carrier_perf['carrier'].astype(str),
+        marker=dict(
+            size=carrier_perf['total_orders'],
+            sizemode='area',
+            sizeref=2.0 * max(carrier_perf['total_orders'].max(), 1) / (20 ** 2) if len(carrier_perf) else 1,
+            color=carrier_perf['avg_rating'],
+            colorscale='RdYlGn',
+            showscale=True,
+            colorbar=dict(title='Customer Rating')
+        ),
+        hovertemplate='<b>%{text}</b><br>Avg Cost: ₹%{x:,.2f}<br>On-Time: %{y:.1f}%<br>Rating: %{marker.color:.2f}<extra></extra>'
+    ))
+    carrier_fig.update_layout(
+        title="Carrier Value Analysis: Cost vs Performance",
+        xaxis_title='Average Cost per Order (₹)',
+        yaxis_title='On-Time Delivery Rate (%)',
+        height=450
+    )
     
-    with col1:
-        st.metric(
-            label="💰 Total Revenue",
-            value=f"₹{metrics['total_revenue']:,.0f}",
-            delta=f"{metrics['revenue_growth']:.1f}% vs target"
-        )
+    return {
+        'cost_pie': pie_fig,
+        'revenue_trend': trend_fig,
+        'carrier_performance': carrier_fig
+    }
+
+@st.cache_resource(show_spinner=False, hash_funcs={DataProcessor: lambda p: p.data_version})
+def build_carrier_score_fig(processor):
+    """Build the Carrier Value Score bar chart once per dataset"""
+    import plotly.express as px  # deferred: only chart pages pay for plotly.express
     
-    with col2:
-        st.metric(
-            label="📉 Cost Leakage",
-            value=f"₹{metrics['cost_leakage']:,.0f}",
-            delta=f"-{metrics['leakage_reduction']:.1f}% (Good!)",
-            delta_color="inverse"
-        )
+    fig = px.bar(
+        processor.calculate_carrier_value_score(),
+        x='carrier',
+        y='carrier_value_score',
+        color='carrier_value_score',
+        color_continuous_scale='RdYlGn',
+        labels={'carrier_value_score': 'CVS (Higher is Better)'},
+        title="Carrier Value Score: Weighted Performance Metric"
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=64, hash_funcs={DataProcessor: lambda p: p.data_version})
+def build_leakage_figures(processor, regions, priorities, carriers):
+    """Build the Cost Leakage charts once per filter selection"""
+    views = get_leakage_views(processor, regions, priorities, carriers)
     
-    with col3:
-        st.metric(
-            label="📊 Profit Margin",
-            value=f"{metrics['profit_margin']:.1f}%",
-            delta=f"{metrics['margin_change']:.1f}%"
-        )
+    # Heatmap: Cost by Route
+    route_matrix = views['route_matrix']
+    heatmap_fig = go.Figure(go.Heatmap(
+        z=route_matrix.to_numpy(),
+        x=route_matrix.columns.tolist(),
+        y=route_matrix.index.tolist(),
+        colorscale='Reds',
+        colorbar=dict(title='Cost per KM (₹)'),
+        hovertemplate='%{y} → %{x}<br>Cost per KM: ₹%{z:.2f}<extra></extra>'
+    ))
+    heatmap_fig.update_layout(
+        title="Average Cost per KM by Route",
+        xaxis_title='destination_city',
+        yaxis_title='origin_warehouse',
+        height=500
+    )
     
-    with col4:
-        st.metric(
-            label="🌱 CO₂ Efficiency",
-            value=f"{metrics['co2_per_order']:.2f} kg/order",
-            delta=f"-{metrics['co2_reduction']:.1f}% (Green!)",
-            delta_color="inverse"
-        )
+    # Waterfall chart: Cost components
+    waterfall_data = views['waterfall_data']
+    
+    waterfall_fig = go.Figure(go.Waterfall(
+        name="Cost Components",
+        orientation="v",
+        measure=waterfall_data['measure'],
+        x=waterfall_data['category'],
+        y=waterfall_data['amount'],
+        connector={"line": {"color": "rgb(63, 63, 63)"}},
+        decreasing={"marker": {"color": "#e74c3c"}},
+        increasing={"marker": {"color": "#2ecc71"}},
+        totals={"marker": {"color": "#3498db"}}
+    ))
+    
+    waterfall_fig.update_layout(
+        title="Total Cost Composition",
+        height=450,
+        showlegend=False
+    )
+    
+    # Cost vs Delivery Speed scatter
+    speed_cost = views['speed_cost']
+    
+    # One WebGL trace per status; marker area scales with rating like px size=, or with
+    # the order count once the processor has binned the orders into grid cells
+    binned = 'order_count' in speed_cost.columns
+    size_col = 'order_count' if binned else 'rating'
+    speed_fig = go.Figure()
+    size_ref = 2.0 * max(speed_cost[size_col].max(), 1) / (20 ** 2) if len(speed_cost) else 1
+    for status, group in speed_cost.groupby('delivery_status', observed=True, sort=False):
+        if binned:
+            customdata = group[['order_count', 'rating']].to_numpy()
+            hovertemplate = '%{customdata[0]} orders (avg rating %{customdata[1]:.1f})<br>Avg Delivery Time: %{x:.0f} h<br>Avg Total Cost: ₹%{y:,.2f}<extra></extra>'
+        else:
+            customdata = group[['order_id', 'carrier']].astype(str).to_numpy()
+            hovertemplate = 'Order %{customdata[0]} (%{customdata[1]})<br>Delivery Time: %{x:.0f} h<br>Total Cost: ₹%{y:,.2f}<extra></extra>'
+        speed_fig.add_trace(go.Scattergl(
+            x=group['delivery_hours'],
+            y=group['total_cost'],
+            mode='markers',
+            name=str(status),
+            marker=dict(
+                color=STATUS_COLORS.get(status),
+                size=group[size_col],
+                sizemode='area',
+                sizeref=size_ref
+            ),
+            customdata=customdata,
+            hovertemplate=hovertemplate
+        ))
+    speed_fig.update_layout(
+        height=450,
+        xaxis_title='Delivery Time (Hours)',
+        yaxis_title='Total Cost (₹)',
+        legend_title_text='Status'
+    )
+    
+    return {
+        'route_heatmap': heatmap_fig,
+        'cost_waterfall': waterfall_fig,
+        'cost_speed': speed_fig
+    }
+
+@st.cache_data(show_spinner=False)
+def build_metric_cards_html(cards, stacked=False):
+    """Build one HTML row of metric cards from (label, value, delta, delta_color) tuples
+
+    Mirrors st.metric's delta arrows and colors: a leading '-' means down, and
+    delta_color='inverse' treats down as good. stacked=True lays the cards out
+    vertically, like consecutive st.metric calls inside a column.
+    """
+    parts = ['<div class="metric-row metric-stack">' if stacked else '<div class="metric-row">']
+    for label, value, delta, delta_color in cards:
+        parts.append('<div class="metric-card">')
+        parts.append(f'<div class="metric-label">{html.escape(label)}</div>')
+        parts.append(f'<div class="metric-value">{html.escape(value)}</div>')
+        if delta:
+            is_down = delta.startswith('-')
+            is_good = is_down if delta_color == 'inverse' else not is_down
+            color = '#09ab3b' if is_good else '#ff2b2b'
+            arrow = '↓' if is_down else '↑'
+            parts.append(f'<div class="metric-delta" style="color: {color};">{arrow} {html.escape(delta.lstrip("-"))}</div>')
+        parts.append('</div>')
+    parts.append('</div>')
+    return ''.join(parts)
+
+def render_kpi_ribbon(processor):
+    """Render the executive KPI ribbon at the top as a single cached HTML block"""
+    metrics = processor.get_key_metrics()
+    
+    cards = (
+        ("💰 Total Revenue", f"₹{metrics['total_revenue']:,.0f}",
+         f"{metrics['revenue_growth']:.1f}% vs target", "normal"),
+        ("📉 Cost Leakage", f"₹{metrics['cost_leakage']:,.0f}",
+         f"-{metrics['leakage_reduction']:.1f}% (Good!)", "inverse"),
+        ("📊 Profit Margin", f"{metrics['profit_margin']:.1f}%",
+         f"{metrics['margin_change']:.1f}%", "normal"),
+        ("🌱 CO₂ Efficiency", f"{metrics['co2_per_order']:.2f} kg/order",
+         f"-{metrics['co2_reduction']:.1f}% (Green!)", "inverse")
+    )
+    st.markdown(build_metric_cards_html(cards), unsafe_allow_html=True)
     
     st.markdown("---")
 
@@ -185,68 +519,22 @@ def render_overview(processor):
     # KPI Ribbon
     render_kpi_ribbon(processor)
     
+    figures = build_overview_figures(processor)
+    
     # Two-column layout for charts
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("Cost Distribution by Category")
-        cost_by_category = processor.get_cost_by_category()
-        fig = px.pie(
-            cost_by_category,
-            values='cost_amount',
-            names='cost_category',
-            hole=0.4,
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figures['cost_pie'], use_container_width=True, config=STATIC_CHART_CONFIG)
     
     with col2:
         st.subheader("Revenue vs Cost Trend")
-        trend_data = processor.get_revenue_cost_trend()
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=trend_data['month'],
-            y=trend_data['revenue'],
-            name='Revenue',
-            line=dict(color='#2ecc71', width=3),
-            fill='tonexty'
-        ))
-        fig.add_trace(go.Scatter(
-            x=trend_data['month'],
-            y=trend_data['cost'],
-            name='Cost',
-            line=dict(color='#e74c3c', width=3),
-            fill='tozeroy'
-        ))
-        fig.update_layout(
-            height=400,
-            hovermode='x unified',
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figures['revenue_trend'], use_container_width=True, config=HOVER_CHART_CONFIG)
     
     # Full-width chart
     st.subheader("Carrier Performance Comparison")
-    carrier_perf = processor.get_carrier_performance()
-    fig = px.scatter(
-        carrier_perf,
-        x='avg_cost',
-        y='on_time_percentage',
-        size='total_orders',
-        color='avg_rating',
-        hover_name='carrier',
-        labels={
-            'avg_cost': 'Average Cost per Order (₹)',
-            'on_time_percentage': 'On-Time Delivery Rate (%)',
-            'avg_rating': 'Customer Rating'
-        },
-        color_continuous_scale='RdYlGn',
-        title="Carrier Value Analysis: Cost vs Performance"
-    )
-    fig.update_layout(height=450)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures['carrier_performance'], use_container_width=True, config=HOVER_CHART_CONFIG)
     
     # Insight box
     st.markdown("""
@@ -263,15 +551,22 @@ def render_overview(processor):
 def render_cost_leakage(processor):
     """Render Cost Leakage Analysis"""
     st.header("🔍 Cost Leakage Analysis")
-    
+    render_leakage_section(processor)
+
+# Filter changes rerun only this fragment, not the sidebar and page chrome
+@st.fragment
+def render_leakage_section(processor):
+    """Render the Cost Leakage filters and everything driven by them"""
     # Filters
+    warehouses = processor.get_unique_warehouses()
+    carriers = processor.get_unique_carriers()
     col1, col2, col3 = st.columns(3)
     
     with col1:
         selected_regions = st.multiselect(
             "Filter by Region",
-            options=processor.get_unique_warehouses(),
-            default=processor.get_unique_warehouses()
+            options=warehouses,
+            default=warehouses
         )
     
     with col2:
@@ -284,17 +579,30 @@ def render_cost_leakage(processor):
     with col3:
         selected_carriers = st.multiselect(
             "Filter by Carrier",
-            options=processor.get_unique_carriers(),
-            default=processor.get_unique_carriers()
+            options=carriers,
+            default=carriers
         )
     
-    # Apply filters
-    filtered_data = processor.filter_data(selected_regions, selected_priorities, selected_carriers)
+    # Apply filters (sorted tuples give stable cache keys across reruns)
+    filter_key = (
+        processor.data_version,
+        tuple(sorted(selected_regions, key=str)),
+        tuple(sorted(selected_priorities, key=str)),
+        tuple(sorted(selected_carriers, key=str))
+    )
+    # Reuse this session's last results when the selection is unchanged (e.g. after a page
+    # switch), skipping even the cache lookup and its deserialization
+    if st.session_state.get('leakage_filter_key') == filter_key:
+        views = st.session_state.leakage_views
+    else:
+        views = get_leakage_views(processor, *filter_key[1:])
+        st.session_state.leakage_filter_key = filter_key
+        st.session_state.leakage_views = views
     
     st.markdown("---")
     
     # Cost leakage metrics
-    leakage_metrics = processor.calculate_cost_leakage(filtered_data)
+    leakage_metrics = views['leakage_metrics']
     
     col1, col2, col3 = st.columns(3)
     
@@ -319,68 +627,19 @@ def render_cost_leakage(processor):
             help="Potential savings from carrier optimization"
         )
     
+    figures = build_leakage_figures(processor, *filter_key[1:])
+    
     # Heatmap: Cost by Route
     st.subheader("🗺️ Cost Heatmap by Route")
-    route_costs = processor.get_route_cost_analysis(filtered_data)
-    fig = px.density_heatmap(
-        route_costs,
-        x='destination_city',
-        y='origin_warehouse',
-        z='avg_cost_per_km',
-        color_continuous_scale='Reds',
-        labels={'avg_cost_per_km': 'Cost per KM (₹)'},
-        title="Average Cost per KM by Route"
-    )
-    fig.update_layout(height=500)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures['route_heatmap'], use_container_width=True)
     
     # Waterfall chart: Cost components
     st.subheader("💧 Cost Breakdown Waterfall")
-    waterfall_data = processor.get_cost_waterfall(filtered_data)
-    
-    fig = go.Figure(go.Waterfall(
-        name="Cost Components",
-        orientation="v",
-        measure=waterfall_data['measure'],
-        x=waterfall_data['category'],
-        y=waterfall_data['amount'],
-        connector={"line": {"color": "rgb(63, 63, 63)"}},
-        decreasing={"marker": {"color": "#e74c3c"}},
-        increasing={"marker": {"color": "#2ecc71"}},
-        totals={"marker": {"color": "#3498db"}}
-    ))
-    
-    fig.update_layout(
-        title="Total Cost Composition",
-        height=450,
-        showlegend=False
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures['cost_waterfall'], use_container_width=True)
     
     # Cost vs Delivery Speed scatter
     st.subheader("⚡ Cost vs Delivery Speed Analysis")
-    speed_cost = processor.get_cost_speed_analysis(filtered_data)
-    
-    fig = px.scatter(
-        speed_cost,
-        x='delivery_hours',
-        y='total_cost',
-        color='delivery_status',
-        size='rating',
-        hover_data=['order_id', 'carrier'],
-        labels={
-            'delivery_hours': 'Delivery Time (Hours)',
-            'total_cost': 'Total Cost (₹)',
-            'delivery_status': 'Status'
-        },
-        color_discrete_map={
-            'On-Time': '#2ecc71',
-            'Slightly-Delayed': '#f39c12',
-            'Severely-Delayed': '#e74c3c'
-        }
-    )
-    fig.update_layout(height=450)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures['cost_speed'], use_container_width=True, config=HOVER_CHART_CONFIG)
 
 def render_optimization_engine(processor):
     """Render Optimization Engine"""
@@ -405,31 +664,25 @@ def render_optimization_engine(processor):
     carrier_scores = processor.calculate_carrier_value_score()
     
     # Display as a bar chart
-    fig = px.bar(
-        carrier_scores,
-        x='carrier',
-        y='carrier_value_score',
-        color='carrier_value_score',
-        color_continuous_scale='RdYlGn',
-        labels={'carrier_value_score': 'CVS (Higher is Better)'},
-        title="Carrier Value Score: Weighted Performance Metric"
-    )
-    fig.update_layout(height=400)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(build_carrier_score_fig(processor), use_container_width=True, config=STATIC_CHART_CONFIG)
     
     # Detailed carrier comparison table
     st.subheader("📋 Detailed Carrier Metrics")
+    # Native column configs are formatted client-side (no per-cell Styler HTML)
     st.dataframe(
-        carrier_scores.style.background_gradient(
-            subset=['carrier_value_score'],
-            cmap='RdYlGn'
-        ).format({
-            'avg_cost': '₹{:.2f}',
-            'on_time_percentage': '{:.1f}%',
-            'avg_rating': '{:.2f}',
-            'co2_per_order': '{:.2f} kg',
-            'carrier_value_score': '{:.2f}'
-        }),
+        carrier_scores,
+        column_config={
+            'avg_cost': st.column_config.NumberColumn(format='₹%.2f'),
+            'on_time_percentage': st.column_config.NumberColumn(format='%.1f%%'),
+            'avg_rating': st.column_config.NumberColumn(format='%.2f'),
+            'co2_per_order': st.column_config.NumberColumn(format='%.2f kg'),
+            'carrier_value_score': st.column_config.ProgressColumn(
+                'carrier_value_score',
+                format='%.2f',
+                min_value=0,
+                max_value=100
+            )
+        },
         use_container_width=True,
         height=300
     )
@@ -448,9 +701,12 @@ def render_optimization_engine(processor):
                 st.markdown(f"**Implementation:** {rec['implementation']}")
             
             with col2:
-                st.metric("Potential Savings", rec['savings'])
-                st.metric("Risk Level", rec['risk'])
-                st.metric("Timeline", rec['timeline'])
+                cards = (
+                    ("Potential Savings", rec['savings'], None, "normal"),
+                    ("Risk Level", rec['risk'], None, "normal"),
+                    ("Timeline", rec['timeline'], None, "normal")
+                )
+                st.markdown(build_metric_cards_html(cards, stacked=True), unsafe_allow_html=True)
     
     # Sustainability comparison
     st.subheader("🌱 Sustainability Impact")
@@ -460,24 +716,21 @@ def render_optimization_engine(processor):
     with col1:
         st.markdown("**Current State**")
         current_metrics = processor.get_sustainability_metrics('current')
-        st.metric("Total CO₂ Emissions", f"{current_metrics['total_co2']:,.0f} kg")
-        st.metric("Average per Order", f"{current_metrics['co2_per_order']:.2f} kg")
+        cards = (
+            ("Total CO₂ Emissions", f"{current_metrics['total_co2']:,.0f} kg", None, "normal"),
+            ("Average per Order", f"{current_metrics['co2_per_order']:.2f} kg", None, "normal")
+        )
+        st.markdown(build_metric_cards_html(cards, stacked=True), unsafe_allow_html=True)
     
     with col2:
         st.markdown("**Optimized State**")
         optimized_metrics = processor.get_sustainability_metrics('optimized')
-        st.metric(
-            "Total CO₂ Emissions",
-            f"{optimized_metrics['total_co2']:,.0f} kg",
-            delta=f"-{optimized_metrics['reduction_pct']:.1f}%",
-            delta_color="inverse"
-        )
-        st.metric(
-            "Average per Order",
-            f"{optimized_metrics['co2_per_order']:.2f} kg",
-            delta=f"-{optimized_metrics['reduction_pct']:.1f}%",
-            delta_color="inverse"
+        reduction = f"-{optimized_metrics['reduction_pct']:.1f}%"
+        cards = (
+            ("Total CO₂ Emissions", f"{optimized_metrics['total_co2']:,.0f} kg", reduction, "inverse"),
+            ("Average per Order", f"{optimized_metrics['co2_per_order']:.2f} kg", reduction, "inverse")
         )
+        st.markdown(build_metric_cards_html(cards, stacked=True), unsafe_allow_html=True)
     
     # Financial benefit of green logistics
     st.markdown("---")
@@ -499,81 +752,8 @@ def render_optimization_engine(processor):
 def render_home():
     """Render the home/landing page"""
     
-    # Add CSS animation for truck
+    # Animated truck banner (styles live in CUSTOM_CSS)
     st.markdown("""
-        <style>
-        @keyframes truck-drive {
-            0% {
-                transform: translateX(-100px);
-                opacity: 0;
-            }
-            10% {
-                opacity: 1;
-            }
-            90% {
-                opacity: 1;
-            }
-            100% {
-                transform: translateX(calc(100vw - 100px));
-                opacity: 0;
-            }
-        }
-        
-        @keyframes road-scroll {
-            0% {
-                background-position: 0 0;
-            }
-            100% {
-                background-position: 100px 0;
-            }
-        }
-        
-        .truck-container {
-            position: relative;
-            width: 100%;
-            height: 150px;
-            overflow: hidden;
-            margin: 20px 0;
-            background: linear-gradient(to bottom, #1e3a5f 0%, #2c5282 70%, #4a5568 70%, #4a5568 75%, transparent 75%);
-            border-radius: 10px;
-        }
-        
-        .road {
-            position: absolute;
-            bottom: 35px;
-            width: 100%;
-            height: 5px;
-            background: repeating-linear-gradient(
-                to right,
-                #fbbf24 0px,
-                #fbbf24 20px,
-                transparent 20px,
-                transparent 40px
-            );
-            animation: road-scroll 1s linear infinite;
-        }
-        
-        .truck-animated {
-            position: absolute;
-            bottom: 20px;
-            width: 120px;
-            height: 120px;
-            animation: truck-drive 8s ease-in-out infinite;
-        }
-        
-        .clouds {
-            position: absolute;
-            top: 20px;
-            width: 100%;
-            height: 60px;
-            background-image: 
-                radial-gradient(ellipse at 20% 50%, rgba(255,255,255,0.3) 0%, transparent 50%),
-                radial-gradient(ellipse at 60% 30%, rgba(255,255,255,0.2) 0%, transparent 50%),
-                radial-gradient(ellipse at 85% 40%, rgba(255,255,255,0.25) 0%, transparent 50%);
-            animation: road-scroll 20s linear infinite;
-        }
-        </style>
-        
         <div class='truck-container'>
             <div class='clouds'></div>
             <div class='road'></div>
@@ -948,7 +1128,7 @@ def main():
         # Load data if not loaded
         if not st.session_state.data_loaded:
             with st.spinner("Loading and processing data..."):
-                processor = load_data()
+                processor = load_data(data_file_signatures())
                 if processor:
                     st.session_state.data_processor = processor
                     st.session_state.data_loaded = True
@@ -957,7 +1137,15 @@ def main():
                     st.error("Failed to load data. Please check if all CSV files are present.")
                     st.stop()
         
-        processor = st.session_state.data_processor
+        if st.session_state.using_custom_data:
+            processor = st.session_state.data_processor
+        else:
+            # Cache lookup on unchanged files; picks up edited CSVs without a manual reload
+            processor = load_data(data_file_signatures())
+            if processor is None:
+                st.error("Failed to load data. Please check if all CSV files are present.")
+                st.stop()
+            st.session_state.data_processor = processor
         
         # Render selected dashboard page
         if st.session_state.current_page == "📊 Overview":
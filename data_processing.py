@@ -5,11 +5,55 @@ This module standardizes column names from the existing CSVs (Order_ID, Order_Da
 merges them on Order_ID, and computes derived metrics used by the Streamlit app.
 """
 
+import itertools
 import pandas as pd
 import numpy as np
 import warnings
 warnings.filterwarnings('ignore')
 
+# Monotonic counter identifying each processed dataset (used as a cache key by the app)
+_data_versions = itertools.count(1)
+
+# Low-cardinality label columns stored as pandas categoricals (raw and renamed forms)
+CATEGORICAL_COLUMNS = ('carrier', 'priority', 'origin', 'destination', 'origin_warehouse', 'destination_city',
+                       'delivery_status', 'quality_issue')
+
+# Columns the dashboard filters on
+FILTER_COLUMNS = ('origin_warehouse', 'priority', 'carrier')
+
+
+def _group_means(codes, n_groups, values):
+    """NaN-skipping per-group mean of a float array over integer group codes (-1 = no group)"""
+    valid = (codes >= 0) & ~np.isnan(values)
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=n_groups)
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return sums / counts
+
+
+def _as_numeric(series):
+    """Coerce a Series to numbers, returning it untouched when it already is numeric"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    return pd.to_numeric(series, errors='coerce')
+
+
+def _safe_divide(numerator, denominator):
+    """Elementwise float division with NaN wherever the denominator is zero (no inf pass)"""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.full(len(numerator), np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def _grid_cells(x, y, n_bins):
+    """Flat cell index of each point on an n_bins x n_bins grid spanning the data (histogram2d binning)"""
+    def axis_bins(v):
+        edges = np.histogram_bin_edges(v, bins=n_bins)
+        return np.clip(np.searchsorted(edges, v, side='right') - 1, 0, n_bins - 1)
+    return axis_bins(x) * n_bins + axis_bins(y)
+
 
 class DataProcessor:
     """Data handling, cleaning, merging and analytics for the provided CSVs."""
@@ -22,14 +66,42 @@ class DataProcessor:
         self.costs = None
         self.merged_data = None
         self._delivered_cache = None  # Cache for delivered orders
+        self._delivered_mask = None  # Boolean ndarray of delivered rows in merged_data
         self._cost_cols_cache = None  # Cache for cost columns
         self._carrier_scores_cache = None  # Cache for carrier value scores
+        self._key_metrics_cache = None  # Overview aggregates, built in process_data
+        self._cost_by_category_cache = None
+        self._trend_cache = None
+        self._carrier_perf_cache = None
+        self._carrier_agg_cache = None  # Per-carrier means shared by performance and value scores
+        self._waterfall_cache = None  # Waterfall for the unfiltered frame
+        self._route_matrix_cache = None  # Route cost matrix for the unfiltered frame
+        self._sustainability_cache = None  # (current, optimized) scenario metrics
+        self._recommendations_cache = None
+        self._green_benefit_cache = None
+        self._filter_codes = {}  # Shifted categorical codes (0 = missing) of filterable columns
+        self._filter_options = {}  # Selectable labels of filterable columns
+        self._filter_cells = None  # Mixed-radix index of each row's filter-code combination
+        self.data_version = None  # Bumped every time process_data runs
 
     def _standardize_cols(self, df):
         """Convert columns to snake_case lower - optimized with list comprehension"""
         df.columns = [c.strip().lower().replace(' ', '_') for c in df.columns]
         return df
 
+    def _optimize_dtypes(self, df):
+        """Downcast float columns to float32 and encode label columns as categoricals"""
+        for col in df.select_dtypes(include=['float64']).columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        return df
+
+    def _read_csv(self, source):
+        """Parse a CSV with the multithreaded pyarrow reader, then normalize names and dtypes"""
+        return self._optimize_dtypes(self._standardize_cols(pd.read_csv(source, engine='pyarrow')))
+
     def load_all_data(self):
         """Load CSVs that exist in the workspace and standardize column names.
 
@@ -37,11 +109,11 @@ class DataProcessor:
         vehicle_fleet.csv, cost_breakdown.csv
         """
         try:
-            self.orders = self._standardize_cols(pd.read_csv('orders.csv'))
-            self.delivery = self._standardize_cols(pd.read_csv('delivery_performance.csv'))
-            self.routes = self._standardize_cols(pd.read_csv('routes_distance.csv'))
-            self.vehicles = self._standardize_cols(pd.read_csv('vehicle_fleet.csv'))
-            self.costs = self._standardize_cols(pd.read_csv('cost_breakdown.csv'))
+            self.orders = self._read_csv('orders.csv')
+            self.delivery = self._read_csv('delivery_performance.csv')
+            self.routes = self._read_csv('routes_distance.csv')
+            self.vehicles = self._read_csv('vehicle_fleet.csv')
+            self.costs = self._read_csv('cost_breakdown.csv')
             return True
         except FileNotFoundError as e:
             print(f"Missing file: {e}")
@@ -52,7 +124,8 @@ class DataProcessor:
 
     def process_data(self):
         """Clean, merge and create derived metrics compatible with app expectations."""
-        # Use direct references instead of copies for merging
+        # Use direct references instead of copies for merging; derived columns below are
+        # added with assign() so the loaded frames are never modified
         orders = self.orders
         delivery = self.delivery
         routes = self.routes
@@ -67,17 +140,23 @@ class DataProcessor:
 
         # Parse dates once
         if 'order_date' in orders.columns:
-            orders['order_date'] = pd.to_datetime(orders['order_date'], errors='coerce')
+            orders = orders.assign(order_date=pd.to_datetime(orders['order_date'], errors='coerce'))
 
         # Build total_cost from cost_breakdown and cache cost columns
         self._cost_cols_cache = [c for c in costs.columns if c != 'order_id']
-        costs['total_cost'] = costs[self._cost_cols_cache].sum(axis=1)
-
-        # Merge all dataframes efficiently
-        merged = (orders
-                  .merge(routes, on='order_id', how='left', suffixes=('', '_route'))
-                  .merge(delivery, on='order_id', how='left', suffixes=('', '_perf'))
-                  .merge(costs[['order_id', 'total_cost'] + self._cost_cols_cache], on='order_id', how='left'))
+        costs = costs.assign(total_cost=np.nansum(costs[self._cost_cols_cache].to_numpy(dtype=float), axis=1))
+
+        # Left-join the per-order tables on order_id in one aligned multi-join instead of
+        # three chained merges; clashing column names get a per-table suffix
+        taken = set(orders.columns)
+        lookups = []
+        for df, suffix in ((routes, '_route'), (delivery, '_perf'),
+                           (costs[['order_id', 'total_cost'] + self._cost_cols_cache], '_cost')):
+            df = df.set_index('order_id')
+            df = df.rename(columns={c: c + suffix for c in df.columns if c in taken})
+            taken.update(df.columns)
+            lookups.append(df)
+        merged = orders.set_index('order_id').join(lookups, how='left').reset_index()
 
         # Batch rename columns
         column_renames = {
@@ -85,10 +164,14 @@ class DataProcessor:
             'destination': 'destination_city',
             'customer_rating': 'rating'
         }
-        merged.rename(columns={k: v for k, v in column_renames.items() if k in merged.columns}, inplace=True)
+        merged.columns = [column_renames.get(c, c) for c in merged.columns]
 
-        # Delivery status: vectorized operation
-        merged['status'] = np.where(merged.get('delivery_status', pd.Series()).notna(), 'Delivered', 'Pending')
+        # Delivery status: two-category Categorical built straight from codes (0 = Delivered)
+        if 'delivery_status' in merged.columns:
+            delivered = merged['delivery_status'].notna().to_numpy()
+        else:
+            delivered = np.zeros(len(merged), dtype=bool)
+        merged['status'] = pd.Categorical.from_codes((~delivered).astype(np.int8), categories=['Delivered', 'Pending'])
 
         # Compute on_time_percentage - vectorized
         if 'promised_delivery_days' in merged.columns and 'actual_delivery_days' in merged.columns:
@@ -104,147 +187,261 @@ class DataProcessor:
         }
         
         for col, series in numeric_conversions.items():
-            merged[col] = pd.to_numeric(series, errors='coerce')
+            merged[col] = _as_numeric(series)
+
+        # Fill missing total_cost. The cost-breakdown sum above is never NaN, so a gap here
+        # means the order has no cost rows at all (its component sum would be 0)
+        total_cost = merged['total_cost'].to_numpy()
+        delivery_cost = merged['delivery_cost_inr'].to_numpy(dtype=float)
+        merged['total_cost'] = np.where(np.isnan(total_cost), np.where(np.isnan(delivery_cost), 0, delivery_cost), total_cost)
 
-        # Fill missing total_cost
-        merged['total_cost'] = merged['total_cost'].fillna(merged['delivery_cost_inr'])
-        merged['total_cost'] = merged['total_cost'].fillna(merged[self._cost_cols_cache].sum(axis=1))
+        # Derived metrics are computed on the raw column arrays and attached in one assign
+        cols = {name: merged[name].to_numpy() for name in
+                ('revenue', 'total_cost', 'distance_km', 'delivery_cost_inr',
+                 'actual_delivery_days', 'promised_delivery_days') if name in merged.columns}
 
         # CO2 emissions estimate
         avg_co2 = vehicles.get('co2_emissions_kg_per_km', pd.Series()).mean()
-        merged['co2_per_km'] = avg_co2 if pd.notna(avg_co2) else 0.45
-        merged['co2_emissions'] = merged['distance_km'] * merged['co2_per_km']
-
-        # Profit and derived metrics - vectorized
-        merged['profit'] = merged['revenue'] - merged['total_cost']
-        merged['profit_margin'] = (merged['profit'] / merged['revenue']) * 100
-        merged['cost_per_km'] = merged['total_cost'] / merged['distance_km']
-        merged['cost_per_km'].replace([np.inf, -np.inf], np.nan, inplace=True)
-
-        # Cost of inefficiency - vectorized
-        merged['delay_days'] = (merged.get('actual_delivery_days', 0) - merged.get('promised_delivery_days', 0)).clip(lower=0)
-        merged['delay_cost'] = merged['delay_days'] * (merged['delivery_cost_inr'] * 0.05 + 50)
-        
-        # Vectorized damage cost calculation
-        merged['damage_cost'] = np.where(
-            (merged.get('quality_issue', 'Perfect') != 'Perfect') & merged.get('quality_issue').notna(),
-            merged['revenue'] * 0.15,
-            0
-        )
-        
-        merged['cost_of_inefficiency'] = merged['delay_cost'].fillna(0) + merged['damage_cost'].fillna(0)
+        co2_factor = avg_co2 if pd.notna(avg_co2) else 0.45
 
-        # Month/Year for trends - vectorized
+        # Profit and derived metrics; zero revenue or distance gives a zero ratio
+        profit = cols['revenue'] - cols['total_cost']
+
+        # Cost of inefficiency: days late past the promise, plus damage (no quality data means none)
+        delay_days = np.maximum(cols.get('actual_delivery_days', 0) - cols.get('promised_delivery_days', 0), 0)
+        quality_issue = merged.get('quality_issue')
+        if quality_issue is None:
+            damage_cost = 0.0
+        else:
+            damaged = (quality_issue.notna() & (quality_issue != 'Perfect')).to_numpy()
+            damage_cost = np.where(damaged, cols['revenue'] * 0.15, 0)
+
+        derived = {
+            'co2_emissions': cols['distance_km'] * co2_factor,
+            'profit': profit,
+            'profit_margin': _safe_divide(profit, cols['revenue']) * 100,
+            'cost_per_km': _safe_divide(cols['total_cost'], cols['distance_km']),
+            'delay_days': delay_days,
+            'delay_cost': delay_days * (cols['delivery_cost_inr'] * 0.05 + 50),
+            'damage_cost': damage_cost,
+        }
+        # These arrays are freshly allocated, so zero their gaps in place; the numeric
+        # fill below then finds nothing to rewrite in the derived columns
+        for values in derived.values():
+            if isinstance(values, np.ndarray):
+                np.copyto(values, 0, where=np.isnan(values))
+        merged = merged.assign(**derived)
+
+        # Month/Year for trends - vectorized. Months are stored as int32 year * 12 + month - 1
+        # (-1 = no date) and only formatted as labels once the trend is aggregated
         if 'order_date' in merged.columns:
-            merged['month'] = merged['order_date'].dt.to_period('M')
-            merged['year'] = merged['order_date'].dt.year
+            order_date = merged['order_date']
+            merged['month'] = (order_date.dt.year * 12 + order_date.dt.month - 1).fillna(-1).astype(np.int32)
+            merged['year'] = order_date.dt.year
         else:
-            merged['month'] = pd.NaT
+            merged['month'] = np.int32(-1)
             merged['year'] = 0
 
-        # Fill missing numeric fields once
-        numeric_cols = merged.select_dtypes(include=[np.number]).columns
-        merged[numeric_cols] = merged[numeric_cols].fillna(0)
+        # Fill missing numeric fields, rewriting only the columns that have gaps
+        for col in merged.select_dtypes(include=[np.number]).columns:
+            if merged[col].hasnans:
+                merged[col] = merged[col].fillna(0)
+
+        # Both components are gap-free after the fill, so this is a single array add
+        merged['cost_of_inefficiency'] = merged['delay_cost'].to_numpy() + merged['damage_cost'].to_numpy()
+
+        # Derived columns come out as float64; single precision matches the downcast inputs
+        # and halves the bytes every later mask, gather and reduction has to move
+        merged = merged.astype(dict.fromkeys(merged.select_dtypes(include=['float64']).columns, np.float32))
+
+        # Categorical codes of the filter columns, shifted so missing values (-1) land on 0,
+        # folded into one mixed-radix cell index per row so filtering is a single lookup
+        self._filter_codes = {}
+        self._filter_options = {}
+        self._filter_cells = np.zeros(len(merged), dtype=np.int64)
+        for col in FILTER_COLUMNS:
+            if col in merged.columns:
+                merged[col] = merged[col].astype('category')
+                self._filter_codes[col] = merged[col].cat.codes.to_numpy().astype(np.int32) + 1
+                self._filter_cells = self._filter_cells * (len(merged[col].cat.categories) + 1) + self._filter_codes[col]
+                # Missing labels stay selectable so the default full selection keeps every row
+                options = tuple(merged[col].cat.categories)
+                if self._filter_codes[col].min(initial=1) == 0:
+                    options += (np.nan,)
+                self._filter_options[col] = options
+
+        # Consolidate the column-by-column build into one block per dtype, so the row
+        # selections done on every filter change touch a few blocks instead of dozens
+        merged = merged.copy()
 
         self.merged_data = merged
+        self._delivered_mask = delivered
         self._delivered_cache = None  # Reset cache when data changes
         self._carrier_scores_cache = None  # Reset cache
+        self._waterfall_cache = None
+        self._route_matrix_cache = None
+
+        # Overview and Optimization aggregates don't depend on user input, so compute them once per load
+        self._key_metrics_cache = self._compute_key_metrics()
+        self._cost_by_category_cache = self._compute_cost_by_category()
+        self._trend_cache = self._compute_revenue_cost_trend()
+        self._carrier_agg_cache = self._compute_carrier_aggregates()
+        self._carrier_perf_cache = self._compute_carrier_performance()
+        self._sustainability_cache = self._compute_sustainability_metrics()
+        self._recommendations_cache = self._compute_optimization_recommendations()
+        self._green_benefit_cache = self._compute_green_logistics_benefit()
+
+        # Fill the remaining lazy caches now: the processor is shared across sessions by
+        # st.cache_resource, so after process_data every accessor must be a pure read
+        self.calculate_carrier_value_score()
+        self.get_cost_waterfall(merged)
+        self.get_route_cost_matrix(merged)
+
+        self.data_version = next(_data_versions)
         return merged
 
-    def _get_delivered_data(self):
-        """Cache and return delivered orders to avoid repeated filtering"""
+    def _get_delivered_data(self, df=None):
+        """Delivered orders of df (default merged_data); the unfiltered slice is cached"""
+        if df is not None and df is not self.merged_data:
+            # status is built from codes with 'Delivered' as code 0
+            return df[df['status'].cat.codes.to_numpy() == 0]
         if self._delivered_cache is None:
-            self._delivered_cache = self.merged_data[self.merged_data['status'] == 'Delivered']
+            self._delivered_cache = self.merged_data[self._delivered_mask]
         return self._delivered_cache
 
     # --- Methods used by app ---
     def get_key_metrics(self):
+        """Get key metrics (precomputed in process_data)"""
+        return self._key_metrics_cache
+
+    def get_cost_by_category(self):
+        """Get cost breakdown by category (precomputed in process_data)"""
+        return self._cost_by_category_cache
+
+    def get_revenue_cost_trend(self):
+        """Get monthly revenue and cost trends (precomputed in process_data)"""
+        return self._trend_cache
+
+    def get_carrier_performance(self):
+        """Get carrier performance metrics (precomputed in process_data)"""
+        return self._carrier_perf_cache
+
+    def _compute_key_metrics(self):
         """Calculate key metrics from delivered orders"""
         df = self._get_delivered_data()
-        total_revenue = df['revenue'].sum()
-        total_cost = df['total_cost'].sum()
+        # Plain numpy reductions on the column arrays skip pandas' dispatch overhead
+        total_revenue = np.nansum(df['revenue'].to_numpy())
+        total_cost = np.nansum(df['total_cost'].to_numpy())
         profit_margin = ((total_revenue - total_cost) / total_revenue * 100) if total_revenue != 0 else 0
-        cost_leakage = df['cost_of_inefficiency'].sum()
-        co2_per_order = df['co2_emissions'].mean()
+        cost_leakage = np.nansum(df['cost_of_inefficiency'].to_numpy())
+        co2_per_order = np.nanmean(df['co2_emissions'].to_numpy()) if len(df) else np.nan
+        # Plain floats keep the dict lightweight and cheap to hash for render caching
         return {
-            'total_revenue': total_revenue,
+            'total_revenue': float(total_revenue),
             'revenue_growth': 0.0,
-            'cost_leakage': cost_leakage,
+            'cost_leakage': float(cost_leakage),
             'leakage_reduction': 0.0,
-            'profit_margin': profit_margin,
+            'profit_margin': float(profit_margin),
             'margin_change': 0.0,
-            'co2_per_order': co2_per_order,
+            'co2_per_order': float(co2_per_order),
             'co2_reduction': 0.0
         }
 
-    def get_cost_by_category(self):
-        """Get cost breakdown by category"""
+    def _compute_cost_by_category(self):
+        """Calculate cost breakdown by category"""
         summary = self.costs[self._cost_cols_cache].sum().reset_index()
         summary.columns = ['cost_category', 'cost_amount']
         return summary
 
-    def get_revenue_cost_trend(self):
-        """Get monthly revenue and cost trends"""
+    def _compute_revenue_cost_trend(self):
+        """Calculate monthly revenue and cost trends"""
         df = self._get_delivered_data()
-        monthly = df.groupby('month', observed=True).agg({'revenue': 'sum', 'total_cost': 'sum'}).reset_index()
-        monthly['month'] = monthly['month'].astype(str)
+        monthly = df[df['month'] >= 0].groupby('month', as_index=False).agg({'revenue': 'sum', 'total_cost': 'sum'})
+        monthly['month'] = [f'{m // 12}-{m % 12 + 1:02d}' for m in monthly['month']]
         monthly.columns = ['month', 'revenue', 'cost']
         return monthly
 
-    def get_carrier_performance(self):
-        """Get carrier performance metrics"""
+    def _compute_carrier_aggregates(self):
+        """Per-carrier means and order counts of delivered orders, in one factorized pass"""
         df = self._get_delivered_data()
-        carrier_perf = df.groupby('carrier').agg({
-            'total_cost': 'mean',
-            'on_time_percentage': 'mean',
-            'order_id': 'count',
-            'rating': 'mean'
-        }).reset_index()
-        carrier_perf.columns = ['carrier', 'avg_cost', 'on_time_percentage', 'total_orders', 'avg_rating']
-        return carrier_perf
+        # Factorize carriers once and reduce every metric with np.bincount over the codes
+        codes, carriers = pd.factorize(df['carrier'], sort=True)
+        n = len(carriers)
+        return pd.DataFrame({
+            'carrier': carriers,
+            'avg_cost': _group_means(codes, n, df['total_cost'].to_numpy(dtype=float)),
+            'on_time_percentage': _group_means(codes, n, df['on_time_percentage'].to_numpy(dtype=float)),
+            'avg_rating': _group_means(codes, n, df['rating'].to_numpy(dtype=float)),
+            'co2_per_order': _group_means(codes, n, df['co2_emissions'].to_numpy(dtype=float)),
+            'total_orders': np.bincount(codes[(codes >= 0) & df['order_id'].notna().to_numpy()], minlength=n)
+        })
+
+    def _compute_carrier_performance(self):
+        """Calculate carrier performance metrics"""
+        return self._carrier_agg_cache[['carrier', 'avg_cost', 'on_time_percentage', 'total_orders', 'avg_rating']]
 
     def get_unique_warehouses(self):
-        """Get list of unique warehouses"""
-        return self.merged_data['origin_warehouse'].unique().tolist() if 'origin_warehouse' in self.merged_data.columns else []
+        """Get unique warehouses (precomputed in process_data)"""
+        return self._filter_options.get('origin_warehouse', ())
 
     def get_unique_carriers(self):
-        """Get list of unique carriers"""
-        return self.merged_data['carrier'].unique().tolist() if 'carrier' in self.merged_data.columns else []
+        """Get unique carriers (precomputed in process_data)"""
+        return self._filter_options.get('carrier', ())
+
+    def _category_keep(self, col, selected):
+        """Lookup table over shifted codes keeping the selected labels, or None when every row matches"""
+        codes = self._filter_codes[col]
+        categories = self.merged_data[col].cat.categories
+        # Lookup table over shifted codes: slot 0 is missing, slot i + 1 is categories[i]
+        keep = np.zeros(len(categories) + 1, dtype=bool)
+        positions = categories.get_indexer([v for v in selected if pd.notna(v)])
+        keep[positions[positions >= 0] + 1] = True
+        keep[0] = any(pd.isna(v) for v in selected)
+        if keep[1:].all() and (keep[0] or codes.min(initial=1) > 0):
+            return None
+        return keep
 
     def filter_data(self, regions, priorities, carriers):
-        """Filter data by regions, priorities and carriers - optimized"""
+        """Filter data by regions, priorities and carriers via categorical codes
+
+        Full selections return merged_data itself, and the result is shared by every
+        Cost Leakage aggregate, so callers must treat it as read-only.
+        """
         df = self.merged_data
         
-        # Apply filters only if values provided
-        masks = []
-        if regions:
-            masks.append(df['origin_warehouse'].isin(regions))
-        if priorities:
-            masks.append(df['priority'].isin(priorities))
-        if carriers:
-            masks.append(df['carrier'].isin(carriers))
+        # Combine the per-column lookup tables into one table over filter cells (outer
+        # product, in the same column order as _filter_cells), then gather once. Empty or
+        # full selections keep the whole column and short-circuit when nothing filters.
+        table = np.ones(1, dtype=bool)
+        filtered = False
+        for col, selected in zip(FILTER_COLUMNS, (regions, priorities, carriers)):
+            if col not in self._filter_codes:
+                continue
+            keep = self._category_keep(col, selected) if selected else None
+            if keep is None:
+                keep = np.ones(len(df[col].cat.categories) + 1, dtype=bool)
+            else:
+                filtered = True
+            table = np.logical_and.outer(table, keep).ravel()
         
-        # Combine all masks with AND operation
-        if masks:
-            combined_mask = masks[0]
-            for mask in masks[1:]:
-                combined_mask &= mask
-            return df[combined_mask]
-        return df
+        return df[table[self._filter_cells]] if filtered else df
 
     def calculate_cost_leakage(self, df):
         """Calculate cost leakage components"""
-        delay_costs = df['delay_cost'].sum()
-        damage_costs = df['damage_cost'].sum()
+        # Reduce the contiguous column arrays directly instead of via pandas Series
+        delay_costs = np.nansum(df['delay_cost'].to_numpy())
+        damage_costs = np.nansum(df['damage_cost'].to_numpy())
         
-        # Carrier overcharges - vectorized calculation
-        carrier_costs = df.groupby('carrier')['cost_per_km'].mean()
+        # Carrier overcharges: spend above the cheapest carrier's average cost per km
+        cost_per_km = df['cost_per_km'].to_numpy(dtype=float)
+        codes, carriers = pd.factorize(df['carrier'])
+        carrier_costs = _group_means(codes, len(carriers), cost_per_km)
         carrier_overcharges = 0
         
-        if not carrier_costs.empty:
-            min_cost = carrier_costs.min()
-            potential_savings = ((df['cost_per_km'] - min_cost) * df['distance_km']).clip(lower=0).sum()
-            carrier_overcharges = potential_savings
+        if not np.isnan(carrier_costs).all():
+            min_cost = np.nanmin(carrier_costs)
+            excess = (cost_per_km - min_cost) * df['distance_km'].to_numpy()
+            carrier_overcharges = np.nansum(np.maximum(excess, 0))
             
         return {
             'delay_costs': delay_costs,
@@ -254,84 +451,149 @@ class DataProcessor:
 
     def get_route_cost_analysis(self, df):
         """Analyze costs by route"""
-        df_filtered = df[df['status'] == 'Delivered']
-        route_analysis = df_filtered.groupby(['origin_warehouse', 'destination_city']).agg({
-            'cost_per_km': 'mean',
-            'total_cost': 'mean',
-            'order_id': 'count'
-        }).reset_index()
-        route_analysis.columns = ['origin_warehouse', 'destination_city', 'avg_cost_per_km', 'avg_total_cost', 'order_count']
-        return route_analysis
+        df_filtered = self._get_delivered_data(df)
+        # Number each observed (origin, destination) pair, then reduce with np.bincount
+        origin_codes, origins = pd.factorize(df_filtered['origin_warehouse'], sort=True)
+        dest_codes, destinations = pd.factorize(df_filtered['destination_city'], sort=True)
+        valid = (origin_codes >= 0) & (dest_codes >= 0)
+        routes, inverse = np.unique(origin_codes[valid] * len(destinations) + dest_codes[valid], return_inverse=True)
+        codes = np.full(len(df_filtered), -1)
+        codes[valid] = inverse
+        n = len(routes)
+        return pd.DataFrame({
+            'origin_warehouse': origins.take(routes // max(len(destinations), 1)),
+            'destination_city': destinations.take(routes % max(len(destinations), 1)),
+            'avg_cost_per_km': _group_means(codes, n, df_filtered['cost_per_km'].to_numpy(dtype=float)),
+            'avg_total_cost': _group_means(codes, n, df_filtered['total_cost'].to_numpy(dtype=float)),
+            'order_count': np.bincount(codes[(codes >= 0) & df_filtered['order_id'].notna().to_numpy()], minlength=n)
+        })
+
+    def get_route_cost_matrix(self, df):
+        """Pivot route costs into an origin x destination cost-per-km matrix for heatmaps"""
+        # Full selections hand back merged_data itself; memoize that case like the waterfall
+        full = df is self.merged_data
+        if full and self._route_matrix_cache is not None:
+            return self._route_matrix_cache
+        
+        # Only the cost-per-km mean is plotted, so skip the other route aggregates
+        df_filtered = self._get_delivered_data(df)
+        route_costs = df_filtered.groupby(['origin_warehouse', 'destination_city'], observed=True)['cost_per_km'].mean()
+        route_matrix = route_costs.unstack('destination_city')
+        if full:
+            self._route_matrix_cache = route_matrix
+        return route_matrix
 
     def get_cost_waterfall(self, df):
         """Generate cost waterfall data"""
-        df_filtered = df[df['status'] == 'Delivered']
-        amounts = [df_filtered[c].mean() for c in self._cost_cols_cache if c in df_filtered.columns]
+        # The unfiltered frame is what most reruns ask for; memoize it
+        full = df is self.merged_data
+        if full and self._waterfall_cache is not None:
+            return self._waterfall_cache
+        
+        df_filtered = self._get_delivered_data(df)
         categories = [c for c in self._cost_cols_cache if c in df_filtered.columns]
+        amounts = df_filtered[categories].mean().to_numpy()
         
-        return pd.DataFrame({
+        waterfall = pd.DataFrame({
             'category': categories + ['Total'],
-            'amount': amounts + [sum(amounts)],
+            'amount': np.concatenate([amounts, [amounts.sum()]]),
             'measure': ['relative'] * len(categories) + ['total']
         })
+        if full:
+            self._waterfall_cache = waterfall
+        return waterfall
 
-    def get_cost_speed_analysis(self, df):
-        """Analyze relationship between cost and delivery speed"""
-        df_filtered = df[df['status'] == 'Delivered'].copy()
-        df_filtered['delivery_hours'] = df_filtered.get('actual_delivery_days', 0) * 24
-        return df_filtered[['order_id', 'delivery_hours', 'total_cost', 'delivery_status', 'rating', 'carrier']]
+    def get_cost_speed_analysis(self, df, max_points=None):
+        """Analyze relationship between cost and delivery speed
+
+        When max_points is given and exceeded, orders are binned on a shared 2D grid per
+        delivery status and one row per non-empty cell is returned (mean position and
+        rating plus an order_count column), so the browser never receives per-order rows.
+        """
+        df_filtered = self._get_delivered_data(df)
+        # Select the plotted columns first so only they, not the whole frame, are copied
+        result = df_filtered[['order_id', 'total_cost', 'delivery_status', 'rating', 'carrier']]
+        result.insert(1, 'delivery_hours', df_filtered.get('actual_delivery_days', 0) * 24)
+        if max_points is None or len(result) <= max_points:
+            return result
+        
+        x = result['delivery_hours'].to_numpy(dtype=float)
+        y = result['total_cost'].to_numpy(dtype=float)
+        status_codes, statuses = pd.factorize(result['delivery_status'])
+        keep = (status_codes >= 0) & np.isfinite(x) & np.isfinite(y)
+        x, y, status_codes = x[keep], y[keep], status_codes[keep]
+        if not len(x):
+            return result.iloc[:0]
+        
+        # Grid side chosen so that statuses x cells can never exceed max_points
+        n_bins = max(int(np.sqrt(max_points / len(statuses))), 1)
+        cells = status_codes * n_bins * n_bins + _grid_cells(x, y, n_bins)
+        occupied, inverse, counts = np.unique(cells, return_inverse=True, return_counts=True)
+        return pd.DataFrame({
+            'delivery_hours': np.bincount(inverse, weights=x) / counts,
+            'total_cost': np.bincount(inverse, weights=y) / counts,
+            'delivery_status': statuses.take(occupied // (n_bins * n_bins)),
+            'rating': _group_means(inverse, len(occupied), result['rating'].to_numpy(dtype=float)[keep]),
+            'order_count': counts
+        })
 
     def calculate_carrier_value_score(self):
         """Calculate carrier value scores with caching"""
         if self._carrier_scores_cache is not None:
             return self._carrier_scores_cache
             
-        df = self._get_delivered_data()
-        carrier_metrics = df.groupby('carrier').agg({
-            'total_cost': 'mean',
-            'on_time_percentage': 'mean',
-            'rating': 'mean',
-            'co2_emissions': 'mean',
-            'order_id': 'count'
-        }).reset_index()
-        carrier_metrics.columns = ['carrier', 'avg_cost', 'on_time_percentage', 'avg_rating', 'co2_per_order', 'total_orders']
-        
-        # Normalize scores - vectorized
-        cost_max = carrier_metrics['avg_cost'].max()
-        co2_max = carrier_metrics['co2_per_order'].max()
+        # Start from the per-carrier aggregates shared with the performance table
+        carrier_metrics = self._carrier_agg_cache.copy()
+        n = len(carrier_metrics)
         
-        carrier_metrics['cost_score'] = (1 - carrier_metrics['avg_cost'] / cost_max) * 100 if cost_max > 0 else 0
-        carrier_metrics['delivery_score'] = carrier_metrics['on_time_percentage']
-        carrier_metrics['satisfaction_score'] = (carrier_metrics['avg_rating'] / 5) * 100
-        carrier_metrics['sustainability_score'] = (1 - carrier_metrics['co2_per_order'] / co2_max) * 100 if co2_max > 0 else 0
+        # Normalize scores on the raw arrays: one (carriers x 4) matrix, one weighted product
+        avg_cost = carrier_metrics['avg_cost'].to_numpy()
+        co2 = carrier_metrics['co2_per_order'].to_numpy()
+        cost_max = np.nanmax(avg_cost, initial=-np.inf)
+        co2_max = np.nanmax(co2, initial=-np.inf)
+        scores = np.column_stack([
+            (1 - avg_cost / cost_max) * 100 if cost_max > 0 else np.zeros(n),
+            carrier_metrics['on_time_percentage'].to_numpy(),
+            carrier_metrics['avg_rating'].to_numpy() / 5 * 100,
+            (1 - co2 / co2_max) * 100 if co2_max > 0 else np.zeros(n)
+        ])
+        score_cols = ['cost_score', 'delivery_score', 'satisfaction_score', 'sustainability_score']
+        carrier_metrics[score_cols] = scores
         
         # Calculate weighted score - vectorized
         weights = np.array([0.4, 0.3, 0.2, 0.1])
-        score_cols = ['cost_score', 'delivery_score', 'satisfaction_score', 'sustainability_score']
-        carrier_metrics['carrier_value_score'] = carrier_metrics[score_cols].fillna(0).dot(weights)
+        carrier_metrics['carrier_value_score'] = np.where(np.isnan(scores), 0, scores) @ weights
         carrier_metrics = carrier_metrics.sort_values('carrier_value_score', ascending=False)
         
         self._carrier_scores_cache = carrier_metrics
         return carrier_metrics
 
     def generate_optimization_recommendations(self):
+        """Get optimization recommendations (precomputed in process_data)"""
+        return self._recommendations_cache
+
+    def _compute_optimization_recommendations(self):
         """Generate optimization recommendations based on carrier scores"""
         carrier_scores = self.calculate_carrier_value_score()
         if len(carrier_scores) < 2:
             return []
             
-        best = carrier_scores.iloc[0]
-        worst = carrier_scores.iloc[-1]
+        # Scores are sorted best first; pick the ends off the raw arrays
+        carriers = carrier_scores['carrier'].to_numpy()
+        best, worst = carriers[0], carriers[-1]
+        best_avg_cost = carrier_scores['avg_cost'].to_numpy()[0]
         df = self._get_delivered_data()
         
-        worst_orders = df[df['carrier'] == worst['carrier']]
-        current_cost = worst_orders['total_cost'].sum()
-        potential_cost = len(worst_orders) * best['avg_cost']
+        # Select the worst carrier's orders by category code instead of label equality
+        carrier = df['carrier']
+        worst_rows = carrier.cat.codes.to_numpy() == carrier.cat.categories.get_loc(worst)
+        current_cost = np.nansum(df['total_cost'].to_numpy()[worst_rows])
+        potential_cost = np.count_nonzero(worst_rows) * best_avg_cost
         savings = max(0, current_cost - potential_cost)
         
         return [{
-            'title': f"Shift orders from {worst['carrier']} to {best['carrier']}",
-            'action': f"Pilot 15% of {worst['carrier']} volume to {best['carrier']}",
+            'title': f"Shift orders from {worst} to {best}",
+            'action': f"Pilot 15% of {worst} volume to {best}",
             'impact': f"Estimated annual saving INR {savings:,.0f}",
             'implementation': 'Pilot then scale',
             'savings': f"INR {savings:,.0f}/year",
@@ -341,22 +603,31 @@ class DataProcessor:
 
     def get_sustainability_metrics(self, scenario='current'):
         """Get sustainability metrics for current or optimized scenario"""
-        df = self._get_delivered_data()
-        total_co2 = df['co2_emissions'].sum()
-        co2_per_order = df['co2_emissions'].mean()
+        current, optimized = self._sustainability_cache
+        return optimized if scenario == 'optimized' else current
+
+    def _compute_sustainability_metrics(self):
+        """Current and optimized sustainability metrics from one pass over CO2 emissions"""
+        co2 = self._get_delivered_data()['co2_emissions'].to_numpy(dtype=float)
+        valid = co2[~np.isnan(co2)]
+        total_co2 = float(valid.sum())
+        co2_per_order = total_co2 / len(valid) if len(valid) else np.nan
         
-        reduction_pct = 20 if scenario == 'optimized' else 0
-        if reduction_pct > 0:
-            total_co2 *= (1 - reduction_pct / 100)
-            co2_per_order *= (1 - reduction_pct / 100)
-            
-        return {
-            'total_co2': total_co2,
-            'co2_per_order': co2_per_order,
+        reduction_pct = 20
+        factor = 1 - reduction_pct / 100
+        current = {'total_co2': total_co2, 'co2_per_order': co2_per_order, 'reduction_pct': 0}
+        optimized = {
+            'total_co2': total_co2 * factor,
+            'co2_per_order': co2_per_order * factor,
             'reduction_pct': reduction_pct
         }
+        return current, optimized
 
     def calculate_green_logistics_benefit(self):
+        """Get green logistics benefits (precomputed in process_data)"""
+        return self._green_benefit_cache
+
+    def _compute_green_logistics_benefit(self):
         """Calculate benefits of green logistics initiatives"""
         df = self._get_delivered_data()
         current_fuel_cost = df['fuel_cost'].sum() if 'fuel_cost' in df.columns else 0
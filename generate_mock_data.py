@@ -5,12 +5,17 @@ Generates 7 interconnected CSV files with realistic relationships and some missi
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Single seeded generator shared by every section, for reproducibility
+rng = np.random.default_rng(42)
+
+# Dates are kept as datetimes while generating and only formatted when the CSVs are written
+DATE_FORMAT = '%Y-%m-%d'
+
+def _ids(prefix, numbers):
+    """Prefixed string ids built in one vectorized pass, e.g. _ids('ORD', [10000]) -> ['ORD10000']"""
+    return np.char.add(prefix, np.asarray(numbers).astype(str))
 
 def generate_mock_data():
     """Generate all 7 CSV files with interconnected relationships"""
@@ -21,32 +26,31 @@ def generate_mock_data():
     vehicle_types = ['Box Truck', 'Van', 'Semi-Truck', 'Refrigerated Truck', 'Flatbed']
     fuel_types = ['Diesel', 'Electric', 'Hybrid', 'CNG']
     
-    vehicles = []
-    for i in range(50):
-        vehicle_type = random.choice(vehicle_types)
-        fuel_type = random.choice(fuel_types)
-        
-        # CO2 emissions based on fuel type
-        co2_factor = {
-            'Diesel': random.uniform(2.5, 3.2),
-            'Electric': random.uniform(0.1, 0.3),
-            'Hybrid': random.uniform(1.2, 1.8),
-            'CNG': random.uniform(1.8, 2.4)
-        }
-        
-        vehicles.append({
-            'vehicle_id': f'VEH{1000+i}',
-            'vehicle_type': vehicle_type,
-            'fuel_type': fuel_type,
-            'capacity_kg': random.randint(500, 15000),
-            'fuel_efficiency_kmpl': random.uniform(5, 25),
-            'co2_per_km': co2_factor[fuel_type],
-            'maintenance_cost_per_km': random.uniform(0.15, 0.45),
-            'year': random.randint(2015, 2024),
-            'status': random.choice(['Active', 'Active', 'Active', 'Maintenance', 'Retired'])
-        })
-    
-    vehicle_fleet_df = pd.DataFrame(vehicles)
+    # CO2 emissions (kg/km) range by fuel type, drawn for all vehicles at once
+    co2_ranges = {
+        'Diesel': (2.5, 3.2),
+        'Electric': (0.1, 0.3),
+        'Hybrid': (1.2, 1.8),
+        'CNG': (1.8, 2.4)
+    }
+    co2_low, co2_high = np.array([co2_ranges[f] for f in fuel_types]).T
+    
+    n_vehicles = 50
+    fuel_idx = rng.integers(0, len(fuel_types), n_vehicles)
+    
+    # Low-cardinality labels of the frames reused by later sections are held as categoricals;
+    # the CSVs are written the same either way
+    vehicle_fleet_df = pd.DataFrame({
+        'vehicle_id': _ids('VEH', 1000 + np.arange(n_vehicles)),
+        'vehicle_type': rng.choice(vehicle_types, n_vehicles),
+        'fuel_type': np.array(fuel_types)[fuel_idx],
+        'capacity_kg': rng.integers(500, 15001, n_vehicles),
+        'fuel_efficiency_kmpl': rng.uniform(5, 25, n_vehicles),
+        'co2_per_km': rng.uniform(co2_low[fuel_idx], co2_high[fuel_idx]),
+        'maintenance_cost_per_km': rng.uniform(0.15, 0.45, n_vehicles),
+        'year': rng.integers(2015, 2025, n_vehicles),
+        'status': rng.choice(['Active', 'Active', 'Active', 'Maintenance', 'Retired'], n_vehicles)
+    }).astype({'vehicle_type': 'category', 'fuel_type': 'category', 'status': 'category'})
     vehicle_fleet_df.to_csv('vehicle_fleet.csv', index=False)
     print(f"✓ Generated {len(vehicle_fleet_df)} vehicle records")
     
@@ -59,30 +63,30 @@ def generate_mock_data():
     
     warehouses = ['WH_East', 'WH_West', 'WH_Central', 'WH_South', 'WH_North']
     
-    routes = []
-    route_id = 1
-    for warehouse in warehouses:
-        for city in cities:
-            if random.random() > 0.3:  # Not all warehouse-city combinations exist
-                distance_km = random.randint(50, 2500)
-                
-                # Traffic patterns affect delivery time
-                traffic_level = random.choice(['Low', 'Medium', 'High'])
-                traffic_factor = {'Low': 1.0, 'Medium': 1.3, 'High': 1.6}
-                
-                routes.append({
-                    'route_id': f'RT{1000+route_id}',
-                    'origin_warehouse': warehouse,
-                    'destination_city': city,
-                    'distance_km': distance_km,
-                    'avg_traffic_level': traffic_level,
-                    'estimated_time_hours': (distance_km / 70) * traffic_factor[traffic_level],
-                    'toll_cost': random.uniform(10, 150) if random.random() > 0.4 else 0,
-                    'route_difficulty': random.choice(['Easy', 'Medium', 'Hard'])
-                })
-                route_id += 1
-    
-    routes_df = pd.DataFrame(routes)
+    # Every warehouse-city pair is a candidate route; not all combinations exist
+    route_warehouse, route_city = (a.ravel() for a in np.meshgrid(warehouses, cities, indexing='ij'))
+    route_exists = rng.random(len(route_warehouse)) > 0.3
+    route_warehouse, route_city = route_warehouse[route_exists], route_city[route_exists]
+    n_routes = len(route_warehouse)
+    
+    distance_km = rng.integers(50, 2501, n_routes)
+    
+    # Traffic patterns affect delivery time
+    traffic_levels = np.array(['Low', 'Medium', 'High'])
+    traffic_factor = np.array([1.0, 1.3, 1.6])
+    traffic_idx = rng.integers(0, len(traffic_levels), n_routes)
+    
+    routes_df = pd.DataFrame({
+        'route_id': _ids('RT', 1001 + np.arange(n_routes)),
+        'origin_warehouse': route_warehouse,
+        'destination_city': route_city,
+        'distance_km': distance_km,
+        'avg_traffic_level': traffic_levels[traffic_idx],
+        'estimated_time_hours': (distance_km / 70) * traffic_factor[traffic_idx],
+        'toll_cost': np.where(rng.random(n_routes) > 0.4, rng.uniform(10, 150, n_routes), 0),
+        'route_difficulty': rng.choice(['Easy', 'Medium', 'Hard'], n_routes)
+    }).astype({'origin_warehouse': 'category', 'destination_city': 'category',
+               'avg_traffic_level': 'category', 'route_difficulty': 'category'})
     routes_df.to_csv('routes_distance.csv', index=False)
     print(f"✓ Generated {len(routes_df)} route records")
     
@@ -93,85 +97,83 @@ def generate_mock_data():
     priorities = ['Standard', 'Express', 'Overnight']
     
     start_date = datetime(2024, 1, 1)
-    orders = []
-    
-    for i in range(200):
-        order_date = start_date + timedelta(days=random.randint(0, 350))
-        
-        # Some recent orders may have missing data
-        is_recent = order_date > datetime(2024, 11, 1)
-        
-        route = random.choice(routes)
-        priority = random.choice(priorities)
-        carrier = random.choice(carriers)
-        
-        # Weight and dimensions
-        weight_kg = random.uniform(10, 5000)
-        volume_m3 = random.uniform(0.5, 50)
-        
-        # Revenue based on priority and weight
-        base_rate = {'Standard': 0.8, 'Express': 1.5, 'Overnight': 2.5}
-        revenue = weight_kg * base_rate[priority] * random.uniform(0.8, 1.2)
-        
-        orders.append({
-            'order_id': f'ORD{10000+i}',
-            'order_date': order_date.strftime('%Y-%m-%d'),
-            'customer_id': f'CUST{random.randint(1000, 1500)}',
-            'origin_warehouse': route['origin_warehouse'],
-            'destination_city': route['destination_city'],
-            'route_id': route['route_id'],
-            'carrier': carrier,
-            'priority': priority,
-            'weight_kg': round(weight_kg, 2),
-            'volume_m3': round(volume_m3, 2),
-            'revenue': round(revenue, 2) if not (is_recent and random.random() > 0.7) else np.nan,
-            'vehicle_assigned': random.choice(vehicle_fleet_df['vehicle_id'].tolist()) if not (is_recent and random.random() > 0.8) else np.nan,
-            'status': random.choice(['Delivered', 'Delivered', 'Delivered', 'In Transit', 'Cancelled']) if not is_recent else 'Pending'
-        })
-    
-    orders_df = pd.DataFrame(orders)
-    orders_df.to_csv('orders.csv', index=False)
+    n_orders = 200
+    
+    # Route, priority, weight and dimensions for all orders; revenue follows from priority and weight
+    base_rate = {'Standard': 0.8, 'Express': 1.5, 'Overnight': 2.5}
+    route_idx = rng.integers(0, len(routes_df), n_orders)
+    order_routes = routes_df.iloc[route_idx]
+    priority_idx = rng.integers(0, len(priorities), n_orders)
+    weight_kg = rng.uniform(10, 5000, n_orders)
+    volume_m3 = rng.uniform(0.5, 50, n_orders)
+    revenue = weight_kg * np.array([base_rate[p] for p in priorities])[priority_idx] * rng.uniform(0.8, 1.2, n_orders)
+    vehicle_assigned = rng.choice(vehicle_fleet_df['vehicle_id'].to_numpy(), n_orders)
+    
+    # Remaining per-order draws
+    order_day_offsets = rng.integers(0, 351, n_orders)
+    order_carriers = rng.choice(carriers, n_orders)
+    customer_numbers = rng.integers(1000, 1501, n_orders)
+    revenue_gap_draw = rng.random(n_orders)
+    vehicle_gap_draw = rng.random(n_orders)
+    order_statuses = rng.choice(['Delivered', 'Delivered', 'Delivered', 'In Transit', 'Cancelled'], n_orders)
+    
+    order_dates = (pd.Timestamp(start_date) + pd.to_timedelta(order_day_offsets, unit='D')).to_numpy()
+    
+    # Some recent orders may have missing data
+    is_recent = order_dates > np.datetime64(datetime(2024, 11, 1))
+    
+    orders_df = pd.DataFrame({
+        'order_id': _ids('ORD', 10000 + np.arange(n_orders)),
+        'order_date': order_dates,
+        'customer_id': _ids('CUST', customer_numbers),
+        'origin_warehouse': order_routes['origin_warehouse'].to_numpy(),
+        'destination_city': order_routes['destination_city'].to_numpy(),
+        'route_id': order_routes['route_id'].to_numpy(),
+        'carrier': order_carriers,
+        'priority': np.array(priorities)[priority_idx],
+        'weight_kg': np.round(weight_kg, 2),
+        'volume_m3': np.round(volume_m3, 2),
+        'revenue': np.where(is_recent & (revenue_gap_draw > 0.7), np.nan, np.round(revenue, 2)),
+        'vehicle_assigned': np.where(is_recent & (vehicle_gap_draw > 0.8), None, vehicle_assigned),
+        'status': np.where(is_recent, 'Pending', order_statuses)
+    }).astype({'origin_warehouse': 'category', 'destination_city': 'category',
+               'carrier': 'category', 'priority': 'category', 'status': 'category'})
+    orders_df.to_csv('orders.csv', index=False, date_format=DATE_FORMAT)
     print(f"✓ Generated {len(orders_df)} order records")
     
     # ==================== 4. DELIVERY PERFORMANCE ====================
     print("Generating delivery_performance.csv...")
     
     # Only delivered orders have performance data
-    delivered_orders = orders_df[orders_df['status'] == 'Delivered']['order_id'].tolist()
-    
-    performance = []
-    for order_id in delivered_orders:
-        order = orders_df[orders_df['order_id'] == order_id].iloc[0]
-        route_info = routes_df[routes_df['route_id'] == order['route_id']].iloc[0]
-        
-        # Expected delivery time
-        expected_hours = route_info['estimated_time_hours']
-        
-        # Actual delivery time (with variability)
-        delay_factor = random.uniform(0.8, 1.5)
-        actual_hours = expected_hours * delay_factor
-        
-        # Delivery status
-        if actual_hours <= expected_hours:
-            delivery_status = 'On Time'
-        elif actual_hours <= expected_hours * 1.1:
-            delivery_status = 'Minor Delay'
-        else:
-            delivery_status = 'Delayed'
-        
-        performance.append({
-            'order_id': order_id,
-            'expected_delivery_date': (pd.to_datetime(order['order_date']) + timedelta(hours=expected_hours)).strftime('%Y-%m-%d'),
-            'actual_delivery_date': (pd.to_datetime(order['order_date']) + timedelta(hours=actual_hours)).strftime('%Y-%m-%d'),
-            'delivery_status': delivery_status,
-            'delay_hours': round(max(0, actual_hours - expected_hours), 2),
-            'on_time_percentage': round(min(100, (expected_hours / actual_hours) * 100), 2),
-            'damage_reported': random.choice([True, False, False, False]),  # 25% damage rate
-            'delivery_attempts': random.randint(1, 3)
-        })
-    
-    delivery_performance_df = pd.DataFrame(performance)
-    delivery_performance_df.to_csv('delivery_performance.csv', index=False)
+    delivered = orders_df[orders_df['status'] == 'Delivered']
+    delivered_orders = delivered['order_id'].tolist()
+    n_delivered = len(delivered)
+    
+    # Expected delivery time from the route, actual delivery time with variability
+    expected_hours = delivered['route_id'].map(routes_df.set_index('route_id')['estimated_time_hours']).to_numpy()
+    actual_hours = expected_hours * rng.uniform(0.8, 1.5, n_delivered)
+    
+    # Delivery status
+    delivery_status = np.select(
+        [actual_hours <= expected_hours, actual_hours <= expected_hours * 1.1],
+        ['On Time', 'Minor Delay'],
+        'Delayed'
+    )
+    
+    # Delivery dates are offset from the order dates with vectorized timedelta arithmetic
+    order_dates = delivered['order_date'].to_numpy()
+    
+    delivery_performance_df = pd.DataFrame({
+        'order_id': delivered_orders,
+        'expected_delivery_date': order_dates + pd.to_timedelta(expected_hours, unit='h'),
+        'actual_delivery_date': order_dates + pd.to_timedelta(actual_hours, unit='h'),
+        'delivery_status': delivery_status,
+        'delay_hours': np.round(np.maximum(0, actual_hours - expected_hours), 2),
+        'on_time_percentage': np.round(np.minimum(100, (expected_hours / actual_hours) * 100), 2),
+        'damage_reported': rng.choice([True, False, False, False], n_delivered),  # 25% damage rate
+        'delivery_attempts': rng.integers(1, 4, n_delivered)
+    }).astype({'delivery_status': 'category'})
+    delivery_performance_df.to_csv('delivery_performance.csv', index=False, date_format=DATE_FORMAT)
     print(f"✓ Generated {len(delivery_performance_df)} delivery performance records")
     
     # ==================== 5. COST BREAKDOWN ====================
@@ -179,64 +181,66 @@ def generate_mock_data():
     
     cost_categories = ['Fuel', 'Labor', 'Toll', 'Maintenance', 'Insurance', 'Carrier Fee', 'Storage']
     
-    costs = []
-    cost_id = 1
-    
-    for order_id in delivered_orders[:150]:  # 150 cost records as specified
-        order = orders_df[orders_df['order_id'] == order_id].iloc[0]
-        route_info = routes_df[routes_df['route_id'] == order['route_id']].iloc[0]
-        
-        # Get vehicle info if available
-        vehicle_id = order['vehicle_assigned']
-        if pd.notna(vehicle_id):
-            vehicle_info = vehicle_fleet_df[vehicle_fleet_df['vehicle_id'] == vehicle_id].iloc[0]
-        else:
-            vehicle_info = vehicle_fleet_df.iloc[0]  # Default vehicle
-        
-        distance = route_info['distance_km']
-        
-        # Calculate various costs
-        fuel_cost = (distance / vehicle_info['fuel_efficiency_kmpl']) * random.uniform(1.2, 1.8)  # fuel price per liter
-        labor_cost = (distance / 70) * random.uniform(25, 45)  # driver hourly rate
-        maintenance_cost = distance * vehicle_info['maintenance_cost_per_km']
-        toll_cost = route_info['toll_cost']
-        insurance_cost = random.uniform(15, 50)
-        
-        # Carrier fee (for outsourced carriers)
-        carrier_fee = order['weight_kg'] * random.uniform(0.3, 0.8) if order['carrier'] != 'In-House' else 0
-        
-        # Storage cost (for delayed orders)
-        delivery_perf = delivery_performance_df[delivery_performance_df['order_id'] == order_id]
-        if not delivery_perf.empty and delivery_perf.iloc[0]['delivery_status'] == 'Delayed':
-            storage_cost = random.uniform(20, 100)
-        else:
-            storage_cost = random.uniform(5, 20)
-        
-        # Add each cost component
-        cost_components = {
-            'Fuel': fuel_cost,
-            'Labor': labor_cost,
-            'Maintenance': maintenance_cost,
-            'Toll': toll_cost,
-            'Insurance': insurance_cost,
-            'Carrier Fee': carrier_fee,
-            'Storage': storage_cost
-        }
-        
-        for category, amount in cost_components.items():
-            costs.append({
-                'cost_id': f'CST{10000+cost_id}',
-                'order_id': order_id,
-                'cost_category': category,
-                'cost_amount': round(amount, 2),
-                'date_incurred': order['order_date'],
-                'vendor': order['carrier'] if category == 'Carrier Fee' else f'{category} Vendor {random.randint(1, 5)}',
-                'payment_status': random.choice(['Paid', 'Paid', 'Pending'])
-            })
-            cost_id += 1
-    
-    cost_breakdown_df = pd.DataFrame(costs)
-    cost_breakdown_df.to_csv('cost_breakdown.csv', index=False)
+    # Route, vehicle and delivery figures of the first 150 delivered orders (150 cost records
+    # as specified), joined once so every cost component is a single array expression
+    cost_orders = (orders_df[orders_df['status'] == 'Delivered'].head(150)
+                   .merge(routes_df[['route_id', 'distance_km', 'toll_cost']], on='route_id', how='left')
+                   .merge(vehicle_fleet_df[['vehicle_id', 'fuel_efficiency_kmpl', 'maintenance_cost_per_km']],
+                          left_on='vehicle_assigned', right_on='vehicle_id', how='left')
+                   .merge(delivery_performance_df[['order_id', 'delivery_status']], on='order_id', how='left'))
+    n_cost_orders = len(cost_orders)
+    
+    # Orders without an assigned vehicle are costed with the first vehicle in the fleet
+    default_vehicle = vehicle_fleet_df.iloc[0]
+    fuel_efficiency = cost_orders['fuel_efficiency_kmpl'].fillna(default_vehicle['fuel_efficiency_kmpl']).to_numpy()
+    maintenance_per_km = cost_orders['maintenance_cost_per_km'].fillna(default_vehicle['maintenance_cost_per_km']).to_numpy()
+    distance = cost_orders['distance_km'].to_numpy(dtype=float)
+    
+    # Calculate various costs
+    fuel_cost = (distance / fuel_efficiency) * rng.uniform(1.2, 1.8, n_cost_orders)  # fuel price per liter
+    labor_cost = (distance / 70) * rng.uniform(25, 45, n_cost_orders)  # driver hourly rate
+    maintenance_cost = distance * maintenance_per_km
+    toll_cost = cost_orders['toll_cost'].to_numpy()
+    insurance_cost = rng.uniform(15, 50, n_cost_orders)
+    
+    # Carrier fee (for outsourced carriers)
+    carrier_fee = np.where(cost_orders['carrier'].to_numpy() != 'In-House',
+                           cost_orders['weight_kg'].to_numpy() * rng.uniform(0.3, 0.8, n_cost_orders), 0)
+    
+    # Storage cost (higher for delayed orders)
+    delayed = (cost_orders['delivery_status'] == 'Delayed').to_numpy()
+    storage_cost = np.where(delayed, rng.uniform(20, 100, n_cost_orders), rng.uniform(5, 20, n_cost_orders))
+    
+    cost_components = {
+        'Fuel': fuel_cost,
+        'Labor': labor_cost,
+        'Maintenance': maintenance_cost,
+        'Toll': toll_cost,
+        'Insurance': insurance_cost,
+        'Carrier Fee': carrier_fee,
+        'Storage': storage_cost
+    }
+    
+    vendor_numbers = rng.integers(1, 6, (n_cost_orders, len(cost_components)))
+    payment_statuses = rng.choice(['Paid', 'Paid', 'Pending'], (n_cost_orders, len(cost_components)))
+    
+    # Long form: one row per (order, category), order-major so ids run order by order.
+    # Raveling the (orders x categories) matrices gives that layout without a Python loop
+    n_categories = len(cost_components)
+    row_category = np.tile(list(cost_components), n_cost_orders)
+    row_carrier = np.repeat(cost_orders['carrier'].to_numpy(), n_categories)
+    
+    cost_breakdown_df = pd.DataFrame({
+        'cost_id': _ids('CST', 10001 + np.arange(n_cost_orders * n_categories)),
+        'order_id': np.repeat(cost_orders['order_id'].to_numpy(), n_categories),
+        'cost_category': row_category,
+        'cost_amount': np.round(np.column_stack(list(cost_components.values())).ravel(), 2),
+        'date_incurred': np.repeat(cost_orders['order_date'].to_numpy(), n_categories),
+        'vendor': np.where(row_category == 'Carrier Fee', row_carrier,
+                           np.char.add(np.char.add(row_category, ' Vendor '), vendor_numbers.ravel().astype(str))),
+        'payment_status': payment_statuses.ravel()
+    })
+    cost_breakdown_df.to_csv('cost_breakdown.csv', index=False, date_format=DATE_FORMAT)
     print(f"✓ Generated {len(cost_breakdown_df)} cost records")
     
     # ==================== 6. WAREHOUSE INVENTORY ====================
@@ -244,79 +248,82 @@ def generate_mock_data():
     
     product_categories = ['Electronics', 'Furniture', 'Apparel', 'Food', 'Industrial', 'Healthcare', 'Automotive']
     
-    inventory = []
-    for warehouse in warehouses:
-        for i in range(random.randint(30, 50)):
-            category = random.choice(product_categories)
-            
-            # Storage costs vary by category
-            storage_cost_map = {
-                'Electronics': random.uniform(0.5, 1.2),
-                'Furniture': random.uniform(0.3, 0.8),
-                'Apparel': random.uniform(0.2, 0.5),
-                'Food': random.uniform(0.8, 1.5),  # Higher due to refrigeration
-                'Industrial': random.uniform(0.4, 0.9),
-                'Healthcare': random.uniform(0.6, 1.3),
-                'Automotive': random.uniform(0.5, 1.0)
-            }
-            
-            inventory.append({
-                'warehouse_id': warehouse,
-                'product_sku': f'SKU{random.randint(10000, 99999)}',
-                'product_category': category,
-                'quantity_on_hand': random.randint(10, 1000),
-                'unit_value': random.uniform(10, 500),
-                'storage_cost_per_day': storage_cost_map[category],
-                'days_in_storage': random.randint(1, 180),
-                'reorder_point': random.randint(20, 100),
-                'last_updated': (datetime.now() - timedelta(days=random.randint(0, 30))).strftime('%Y-%m-%d')
-            })
-    
-    warehouse_inventory_df = pd.DataFrame(inventory)
-    warehouse_inventory_df.to_csv('warehouse_inventory.csv', index=False)
+    # Storage costs vary by category (Food is higher due to refrigeration)
+    storage_cost_ranges = {
+        'Electronics': (0.5, 1.2),
+        'Furniture': (0.3, 0.8),
+        'Apparel': (0.2, 0.5),
+        'Food': (0.8, 1.5),
+        'Industrial': (0.4, 0.9),
+        'Healthcare': (0.6, 1.3),
+        'Automotive': (0.5, 1.0)
+    }
+    storage_low, storage_high = np.array([storage_cost_ranges[c] for c in product_categories]).T
+    
+    items_per_warehouse = rng.integers(30, 51, len(warehouses))
+    n_items = items_per_warehouse.sum()
+    category_idx = rng.integers(0, len(product_categories), n_items)
+    
+    warehouse_inventory_df = pd.DataFrame({
+        'warehouse_id': np.repeat(warehouses, items_per_warehouse),
+        'product_sku': _ids('SKU', rng.integers(10000, 100000, n_items)),
+        'product_category': np.array(product_categories)[category_idx],
+        'quantity_on_hand': rng.integers(10, 1001, n_items),
+        'unit_value': rng.uniform(10, 500, n_items),
+        'storage_cost_per_day': rng.uniform(storage_low[category_idx], storage_high[category_idx]),
+        'days_in_storage': rng.integers(1, 181, n_items),
+        'reorder_point': rng.integers(20, 101, n_items),
+        'last_updated': pd.Timestamp.now() - pd.to_timedelta(rng.integers(0, 31, n_items), unit='D')
+    })
+    warehouse_inventory_df.to_csv('warehouse_inventory.csv', index=False, date_format=DATE_FORMAT)
     print(f"✓ Generated {len(warehouse_inventory_df)} inventory records")
     
     # ==================== 7. CUSTOMER FEEDBACK ====================
     print("Generating customer_feedback.csv...")
     
-    feedback = []
-    for order_id in delivered_orders[:100]:  # Feedback for 100 orders
-        order = orders_df[orders_df['order_id'] == order_id].iloc[0]
-        delivery_perf = delivery_performance_df[delivery_performance_df['order_id'] == order_id].iloc[0]
-        
-        # Rating based on delivery performance
-        if delivery_perf['delivery_status'] == 'On Time':
-            rating = random.randint(4, 5)
-        elif delivery_perf['delivery_status'] == 'Minor Delay':
-            rating = random.randint(3, 4)
-        else:
-            rating = random.randint(1, 3)
-        
-        # Damage affects rating
-        if delivery_perf['damage_reported']:
-            rating = max(1, rating - random.randint(1, 2))
-        
-        feedback_texts = {
-            5: ['Excellent service!', 'Very fast delivery', 'Perfect condition', 'Highly recommend'],
-            4: ['Good service', 'Minor issues but overall satisfied', 'Will use again'],
-            3: ['Average service', 'Some delays', 'Could be better'],
-            2: ['Poor service', 'Significant delays', 'Not satisfied'],
-            1: ['Terrible experience', 'Package damaged', 'Never again']
-        }
-        
-        feedback.append({
-            'feedback_id': f'FB{10000+len(feedback)}',
-            'order_id': order_id,
-            'customer_id': order['customer_id'],
-            'rating': rating,
-            'feedback_text': random.choice(feedback_texts[rating]),
-            'feedback_date': delivery_perf['actual_delivery_date'],
-            'carrier': order['carrier'],
-            'would_recommend': rating >= 4
-        })
-    
-    customer_feedback_df = pd.DataFrame(feedback)
-    customer_feedback_df.to_csv('customer_feedback.csv', index=False)
+    # Rating range by delivery status
+    rating_ranges = {'On Time': (4, 5), 'Minor Delay': (3, 4), 'Delayed': (1, 3)}
+    feedback_texts = {
+        5: ['Excellent service!', 'Very fast delivery', 'Perfect condition', 'Highly recommend'],
+        4: ['Good service', 'Minor issues but overall satisfied', 'Will use again'],
+        3: ['Average service', 'Some delays', 'Could be better'],
+        2: ['Poor service', 'Significant delays', 'Not satisfied'],
+        1: ['Terrible experience', 'Package damaged', 'Never again']
+    }
+    
+    feedback_perf = delivery_performance_df.head(100)  # Feedback for 100 orders
+    feedback_orders = orders_df.set_index('order_id').loc[feedback_perf['order_id']]
+    n_feedback = len(feedback_perf)
+    rating_draw = rng.random(n_feedback)
+    damage_penalty = rng.integers(1, 3, n_feedback)
+    text_draw = rng.random(n_feedback)
+    
+    # Rating based on delivery performance, drawn uniformly within the status range
+    status = feedback_perf['delivery_status']
+    rating_low = status.map({s: r[0] for s, r in rating_ranges.items()}).to_numpy(dtype=int)
+    rating_high = status.map({s: r[1] for s, r in rating_ranges.items()}).to_numpy(dtype=int)
+    ratings = rating_low + (rating_draw * (rating_high - rating_low + 1)).astype(int)
+    
+    # Damage affects rating
+    ratings = np.where(feedback_perf['damage_reported'].to_numpy(), np.maximum(1, ratings - damage_penalty), ratings)
+    
+    # Pick texts one rating bucket at a time (five array gathers, not one choice per order)
+    feedback_text = np.empty(n_feedback, dtype=object)
+    for rating, options in feedback_texts.items():
+        in_bucket = ratings == rating
+        feedback_text[in_bucket] = np.array(options)[(text_draw[in_bucket] * len(options)).astype(int)]
+    
+    customer_feedback_df = pd.DataFrame({
+        'feedback_id': _ids('FB', 10000 + np.arange(n_feedback)),
+        'order_id': feedback_perf['order_id'].to_numpy(),
+        'customer_id': feedback_orders['customer_id'].to_numpy(),
+        'rating': ratings,
+        'feedback_text': feedback_text,
+        'feedback_date': feedback_perf['actual_delivery_date'].to_numpy(),
+        'carrier': feedback_orders['carrier'].to_numpy(),
+        'would_recommend': ratings >= 4
+    })
+    customer_feedback_df.to_csv('customer_feedback.csv', index=False, date_format=DATE_FORMAT)
     print(f"✓ Generated {len(customer_feedback_df)} customer feedback records")
     
     print("\n" + "="*60)